@@ -1,23 +1,39 @@
-import io
+import functools
 import os
-import shutil
-import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Union
 
 import click
 import geojson
 import geopandas as gpd
+import matplotlib
 import matplotlib.pyplot as plt
+import shapely.geometry as sg
 import tqdm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from PIL import Image
 
 from tile_tools.common.set import CapturingSet
-from tile_tools.common.types import Geom, Tile
-from tile_tools.cover.gj import tile_to_feature
+from tile_tools.common.types import BBox, Geom, Tile
 from tile_tools.cover.tiles import tiles
+from tile_tools.tilebelt import tile_to_bbox
 
-# Temporary directory to store rendered output
-BASE_DIR = ".render"
+# Frames are rendered in worker processes, so use a non-interactive backend.
+matplotlib.use("Agg")
+
+# Canvas and tile layer reused for every frame rendered in a worker process.
+# These are set up by `init_figure`.
+_canvas: Optional[FigureCanvasAgg] = None
+_layer: Optional[PolyCollection] = None
+
+# Outlines of the tiles currently drawn in `_layer`, by tile. Only the tiles
+# that changed since the last frame a worker rendered are touched.
+_outlines = dict[Tile, list[tuple[float, float]]]()
+
+# Tiles show up in many frames, so only compute the bounds of each one once.
+tile_bounds = functools.lru_cache(maxsize=None)(tile_to_bbox)
 
 # Palette to use for rendering
 BASE_PALETTE = {
@@ -42,85 +58,149 @@ def get_geom(f: Union[Geom, geojson.Feature]) -> Geom:
     return f.geometry if hasattr(f, "geometry") else f
 
 
-def get_simple_log(tileset: CapturingSet) -> list[set[Tile]]:
+def get_simple_log(tileset: CapturingSet) -> list[frozenset[Tile]]:
     """Get a simplified log from the Capturing set.
 
+    The captured log only contains deltas, so snapshots are reconstructed by
+    replaying them in order, starting from an empty set.
+
     Args:
         tileset - Tile set with captured log
 
     Returns:
         List of tileset change snapshots with duplicates removed.
     """
-    reduced = list[set[Tile]]()
-
-    prev: Optional[set] = None
-    for snapshot in tileset.log:
-        if snapshot == prev:
-            continue
-        prev = snapshot
-        reduced.append(snapshot)
+    current = set[Tile]()
+    reduced = [frozenset(current)]
+
+    for added, removed in tileset.log:
+        changed = False
+        for t in removed:
+            if t in current:
+                current.discard(t)
+                changed = True
+        for t in added:
+            if t not in current:
+                current.add(t)
+                changed = True
+        if changed:
+            reduced.append(frozenset(current))
 
     return reduced
 
 
-def gen_geojson(geo, ts: set[Tile]) -> geojson.FeatureCollection:
-    """Generate a FeatureCollection with the given tileset and original geom.
+def get_bounds(geo: Geom, log: list[frozenset[Tile]]) -> BBox:
+    """Get the bounds of everything that will be drawn in the animation.
 
     Args:
         geo - Original geometry
-        ts - Tile set
+        log - Tileset snapshots
+
+    Returns:
+        Bounding box as (w, s, e, n) covering the geometry and every tile.
+    """
+    w, s, e, n = sg.shape(geo).bounds
+    for t in frozenset().union(*log):
+        tw, ts, te, tn = tile_bounds(t)
+        w, s, e, n = min(w, tw), min(s, ts), max(e, te), max(n, tn)
+    return (w, s, e, n)
+
+
+def init_figure(geo: Geom, bounds: BBox, palette=BASE_PALETTE):
+    """Set up the figure shared by every frame rendered in this process.
+
+    The original geometry never changes, so it's drawn once here. The axis
+    limits are fixed to `bounds` so they don't need to be recomputed for each
+    frame.
+
+    Args:
+        geo - Original geometry
+        bounds - Bounding box of the whole animation
         palette - Colors to use for render
+    """
+    global _canvas, _layer
+    fig, ax = plt.subplots()
+    _canvas = FigureCanvasAgg(fig)
+    gpd.GeoSeries([sg.shape(geo)], crs="EPSG:4326").plot(
+        ax=ax, edgecolor=palette["shape_stroke"], alpha=0.5, facecolor="white"
+    )
+    w, s, e, n = bounds
+    ax.set_xlim(w, e)
+    ax.set_ylim(s, n)
+    ax.autoscale(False)
+    _layer = PolyCollection(
+        [], edgecolor=palette["shape_stroke"], alpha=0.5, facecolor="white"
+    )
+    ax.add_collection(_layer)
+
+
+def render_image(ts: frozenset[Tile]) -> Image.Image:
+    """Render a tileset as an image.
+
+    Expects `init_figure` to have been called in this process already. The
+    tile layer is updated with only the tiles added or removed since the last
+    frame this process rendered, so consecutive frames are cheap to set up.
+
+    The image is read straight from the figure's canvas, so nothing is
+    written to disk. It's converted to a palette image here since that's
+    what the GIF encoder needs anyway, and it's a third of the size.
+
+    Args:
+        ts - tileset
 
     Returns:
-        GeoJSON FeatureCollection
+        Rendered frame as a palette image
     """
-    # Feature with the original outline
-    fts = [geojson.Feature(geometry=geo)]
+    assert _canvas is not None and _layer is not None, "init_figure wasn't called"
 
-    # Tile features
-    tile_fts = [tile_to_feature(t) for t in ts]
+    for t in _outlines.keys() - ts:
+        del _outlines[t]
+    for t in ts - _outlines.keys():
+        w, s, e, n = tile_bounds(t)
+        _outlines[t] = [(w, s), (e, s), (e, n), (w, n)]
+    _layer.set_verts(list(_outlines.values()))
 
-    fts += tile_fts
+    _canvas.draw()
+    im = Image.frombuffer("RGBA", _canvas.get_width_height(), _canvas.buffer_rgba())
+    return im.convert("RGB").convert("P", palette=Image.Palette.ADAPTIVE)
 
-    return geojson.FeatureCollection(features=fts)
 
+def render_frames(log: list[frozenset[Tile]]) -> list[Image.Image]:
+    """Render a run of consecutive frames.
 
-def render_image(geo, ts: set[Tile], dest: str, palette=BASE_PALETTE):
-    """Render a tileset as an image at the given destination.
+    Consecutive frames only differ by a few tiles, so giving each worker a
+    run of them keeps the per-frame updates in `render_image` small.
 
     Args:
-        ts - tileset
-        dest - location of output file
+        log - Tileset snapshots, in order
+
+    Returns:
+        Rendered frames, in the same order
     """
-    with io.StringIO() as stream:
-        gj = gen_geojson(geo, ts)
-        geojson.dump(gj, stream)
-        stream.seek(0)
-        pgj = gpd.read_file(stream)
-        fig = pgj.plot(
-            edgecolor=palette["shape_stroke"], alpha=0.5, facecolor="white"
-        ).get_figure()
-        fig.savefig(dest)
-        plt.close(fig)
-
-
-def render_gif(frames: list[str], out: str, fps: int, last_pause: int = 30):
-    """Render a gif from the given frames.
+    return [render_image(ts) for ts in log]
 
-    Depends on ImageMagick's `convert` utility.
+
+def render_gif(images: list[Image.Image], out: str, fps: int, last_pause: int = 30):
+    """Render a gif from the given frames.
 
     Args:
-        frames - List of images on disk containing frames, in order
+        images - List of frames, in order
         out - Output file path
         fps - Frames per second
-        last_pause - Number of times to repeat last frame to add a pause
+        last_pause - Number of frames to hold the last frame for
     """
-    ticks = 100  # Number of ticks per second
-    delay = round(
-        ticks / fps
-    )  # (ticks per second) / (frames per second) = ticks per frame
-    frames = frames + frames[-1:] * last_pause
-    subprocess.run(["convert", "-delay", str(int(delay)), *frames, out])
+    # Frame durations are given in milliseconds. Hold the last frame instead
+    # of repeating it so it only needs to be encoded once.
+    delay = round(1000 / fps)
+    durations = [delay] * (len(images) - 1) + [delay * (last_pause + 1)]
+    images[0].save(
+        out,
+        save_all=True,
+        append_images=images[1:],
+        duration=durations,
+        loop=0,
+        optimize=True,
+    )
 
 
 @click.command()
@@ -151,19 +231,26 @@ def run(*, zmin: int, zmax: int, out: str, fps: int):
     log = get_simple_log(tileset)
 
     print("Rendering frames ...", file=sys.stderr)
-    frames = list[str]()
-    shutil.rmtree(BASE_DIR, ignore_errors=True)
-    os.makedirs(BASE_DIR, exist_ok=True)
-    for i, ts in enumerate(tqdm.tqdm(log, unit="frames")):
-        name = os.path.join(BASE_DIR, f"frame{i}.png")
-        render_image(geo, ts, name)
-        frames.append(name)
+    # Frames are independent of each other, so render them in parallel. Each
+    # worker draws the original geometry once and reuses it for every frame.
+    # Workers get runs of consecutive frames so they only need to draw the
+    # difference from one frame to the next.
+    workers = os.cpu_count() or 1
+    size = max(1, len(log) // (workers * 4))
+    runs = [log[i : i + size] for i in range(0, len(log), size)]
+    images = list[Image.Image]()
+    progress = tqdm.tqdm(total=len(log), unit="frames")
+    with progress, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_figure,
+        initargs=(geo, get_bounds(geo, log)),
+    ) as executor:
+        for frames in executor.map(render_frames, runs):
+            images.extend(frames)
+            progress.update(len(frames))
 
     print("Rendering animation ...", file=sys.stderr)
-    render_gif(frames, out, fps)
-
-    print("Cleaning up ...", file=sys.stderr)
-    shutil.rmtree(BASE_DIR)
+    render_gif(images, out, fps)
 
     print("Done!", file=sys.stderr)
 
@@ -0,0 +1,80 @@
+"""Test the tile_tools/common/set module."""
+import importlib.util
+import operator
+import os
+
+import pytest
+
+from tile_tools.common.set import CapturingSet, Delta
+
+# Contents of the set before each operation.
+START = {1, 2, 3, 4, 5}
+
+# Every method that mutates a set, as (name, operation) pairs. Each operation
+# is applied the same way to a `CapturingSet` and to a plain `set`.
+OPERATIONS = [
+    ("add", lambda s: s.add(9)),
+    ("add_existing", lambda s: s.add(1)),
+    ("update", lambda s: s.update({1, 8}, [9])),
+    ("remove", lambda s: s.remove(2)),
+    ("discard", lambda s: s.discard(3)),
+    ("discard_missing", lambda s: s.discard(10)),
+    ("pop", lambda s: [s.pop() for _ in range(len(s))]),
+    ("clear", lambda s: s.clear()),
+    ("difference_update", lambda s: s.difference_update({1}, [2, 10])),
+    ("intersection_update", lambda s: s.intersection_update({1, 2, 3, 10}, [2, 3])),
+    ("symmetric_difference_update", lambda s: s.symmetric_difference_update([3, 11])),
+    ("ior", lambda s: operator.ior(s, {5, 6})),
+    ("isub", lambda s: operator.isub(s, {4, 6})),
+    ("iand", lambda s: operator.iand(s, {1, 4, 6})),
+    ("ixor", lambda s: operator.ixor(s, {4, 6})),
+]
+
+
+def replay(log: list[Delta]) -> set[int]:
+    """Rebuild a set from an empty one by applying its logged deltas."""
+    s = set[int]()
+    for added, removed in log:
+        s -= removed
+        s |= added
+    return s
+
+
+@pytest.mark.parametrize(
+    "op", [o[1] for o in OPERATIONS], ids=[o[0] for o in OPERATIONS]
+)
+def test_capturing_set_matches_set(op):
+    plain = set(START)
+    captured = CapturingSet(START)
+
+    op(plain)
+    op(captured)
+
+    assert captured == plain
+    assert replay(captured.log) == plain
+
+
+def test_capturing_set_skips_noop_changes():
+    captured = CapturingSet(START)
+    captured.add(1)
+    captured.discard(10)
+    captured.update({2, 3})
+    assert len(captured.log) == 1
+
+
+def test_get_simple_log_ends_at_final_set():
+    for mod in ["click", "geopandas", "matplotlib", "PIL", "tqdm"]:
+        pytest.importorskip(mod)
+    path = os.path.join(os.path.dirname(__file__), "..", "scripts", "render.py")
+    spec = importlib.util.spec_from_file_location("render", path)
+    assert spec is not None and spec.loader is not None
+    render = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(render)
+
+    captured = CapturingSet(START)
+    for _, op in OPERATIONS:
+        op(captured)
+
+    log = render.get_simple_log(captured)
+    assert log[0] == frozenset()
+    assert log[-1] == frozenset(captured)
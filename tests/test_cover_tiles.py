@@ -23,21 +23,31 @@ A few other changes:
 Original source:
 https://github.com/mapbox/tile-cover/blob/f5f784ec76765aabb519f139f02345b1cb5e3fe9/test/test.js
 """
-import copy
+import collections
+import functools
+import json
 import os
 import warnings
-from typing import Union
+from typing import Tuple, Union
 
 import geojson
+import numpy as np
 import pytest
 import shapely
+import shapely.affinity
 import shapely.geometry as sg
-from turfpy.measurement import area, center
-from turfpy.transformation import intersect, union
 
 import tile_tools.cover as cover
-from tile_tools.common.types import Geom
+from tile_tools.common.types import Geom, Tile
+from tile_tools.cover import ZoomInput
+from tile_tools.cover.tiles import _project_line, simplify_tileset
 from tile_tools.settings import DEFAULT_PRECISION
+from tile_tools.tilebelt import (
+    point_to_tile_fraction,
+    tile_to_bbox,
+    tile_to_geojson,
+    tile_to_point,
+)
 
 # % error to accept when comparing areas of geometries.
 DEFAULT_TOLERANCE = 1.0e-7
@@ -119,15 +129,51 @@ def test_edgeline():
     verify_cover(line.geometry, zoom)
 
 
-def test_polygon():
-    polygon = fixture("polygon")
-    zoom = (1, 15)
+# Fixtures that are checked by the number of tiles in their cover, along with
+# the usual comparison against the expected output and `verify_cover`. Each
+# one is an independent test case, so they can be run in parallel.
+COUNTED_FIXTURES = [
+    ("polygon", (1, 15), 122),
+    ("multiline", (1, 8), 20),
+    ("uk", (7, 9), 68),
+    ("donut", (16, 16), 310),
+    ("russia", (6, 6), 259),
+    ("degenring", (11, 15), 197),
+    ("spiked", (10, 10), 1742),
+    ("blocky", (6, 6), 31),
+    ("pyramid", (10, 10), 530),
+    ("tetris", (10, 10), 255),
+]
+
+
+@pytest.mark.parametrize(
+    "name,zoom,expected_len", COUNTED_FIXTURES, ids=[f[0] for f in COUNTED_FIXTURES]
+)
+def test_counted_fixture(name: str, zoom: ZoomInput, expected_len: int):
+    geom = get_geom(fixture(name))
 
-    assert len(cover.tiles(polygon, zoom)) == 122, "polygon tiles"
-    assert len(cover.indexes(polygon, zoom)) == 122, "polygon indexes"
+    assert len(cover.tiles(geom, zoom)) == expected_len, f"{name} tiles"
+    assert len(cover.indexes(geom, zoom)) == expected_len, f"{name} indexes"
 
-    compare_fixture(polygon, zoom, "polygon_out")
-    verify_cover(polygon, zoom)
+    compare_fixture(geom, zoom, f"{name}_out")
+    verify_cover(geom, zoom)
+
+
+def test_tiles_hilbert():
+    geom = get_geom(fixture("tetris"))
+    zoom = (10, 10)
+
+    ordered = cover.tiles_hilbert(geom, zoom)
+    assert sorted(ordered) == sorted(cover.tiles(geom, zoom))
+
+    # Walking the tiles in curve order should cover less distance than walking
+    # them row by row.
+    def walk(ts: list[Tile]) -> int:
+        return sum(
+            abs(t1[0] - t0[0]) + abs(t1[1] - t0[1]) for t0, t1 in zip(ts, ts[1:])
+        )
+
+    assert walk(ordered) < walk(sorted(ordered))
 
 
 def test_multipoint():
@@ -155,28 +201,6 @@ def test_multipoint():
     verify_cover(multipoint.geometry, zoom)
 
 
-def test_multiline():
-    multiline = fixture("multiline")
-    zoom = (1, 8)
-
-    assert len(cover.tiles(multiline.geometry, zoom)) == 20, "multiline tiles"
-    assert len(cover.indexes(multiline.geometry, zoom)) == 20, "multiline indexes"
-
-    compare_fixture(multiline.geometry, zoom, "multiline_out")
-    verify_cover(multiline.geometry, zoom)
-
-
-def test_uk():
-    uk = fixture("uk")
-    zoom = (7, 9)
-
-    assert len(cover.tiles(uk.geometry, zoom)) == 68, "uk tiles"
-    assert len(cover.indexes(uk.geometry, zoom)) == 68, "uk indexes"
-
-    compare_fixture(uk.geometry, zoom, "uk_out")
-    verify_cover(uk.geometry, zoom)
-
-
 def test_building():
     building = fixture("building")
     zoom = (18, 18)
@@ -200,39 +224,6 @@ def test_building():
     verify_cover(building, zoom)
 
 
-def test_donut():
-    donut = fixture("donut")
-    zoom = (16, 16)
-
-    assert len(cover.tiles(donut, zoom)) == 310, "donut tiles"
-    assert len(cover.indexes(donut, zoom)) == 310, "donut indexes"
-
-    compare_fixture(donut, zoom, "donut_out")
-    verify_cover(donut, zoom)
-
-
-def test_russia():
-    russia = fixture("russia")
-    zoom = (6, 6)
-
-    assert len(cover.tiles(russia, zoom)) == 259, "russia tiles"
-    assert len(cover.indexes(russia, zoom)) == 259, "russia indexes"
-
-    compare_fixture(russia, zoom, "russia_out")
-    verify_cover(russia, zoom)
-
-
-def test_degenerate_ring():
-    degenring = fixture("degenring")
-    zoom = (11, 15)
-
-    assert len(cover.tiles(degenring, zoom)) == 197, "degenring tiles"
-    assert len(cover.indexes(degenring, zoom)) == 197, "degenring indexes"
-
-    compare_fixture(degenring, zoom, "degenring_out")
-    verify_cover(degenring, zoom)
-
-
 def test_invalid_polygon_hourglass():
     # NOTE: The original library tests that an error is raised when evaluating
     # invalid shapes (in this case, "non-noded intersection"). Our library is
@@ -308,50 +299,6 @@ def test_small_polygon():
     verify_cover(building, zoom)
 
 
-def test_spiked_polygon():
-    spiked = fixture("spiked")
-    zoom = (10, 10)
-
-    assert len(cover.tiles(spiked, zoom)) == 1742, "spiked tiles"
-    assert len(cover.indexes(spiked, zoom)) == 1742, "spiked indexes"
-
-    compare_fixture(spiked, zoom, "spiked_out")
-    verify_cover(spiked, zoom)
-
-
-def test_blocky_polygon():
-    blocky = fixture("blocky")
-    zoom = (6, 6)
-
-    assert len(cover.tiles(blocky, zoom)) == 31, "blocky tiles"
-    assert len(cover.indexes(blocky, zoom)) == 31, "blocky indexes"
-
-    compare_fixture(blocky, zoom, "blocky_out")
-    verify_cover(blocky, zoom)
-
-
-def test_pyramid_polygon():
-    pyramid = fixture("pyramid")
-    zoom = (10, 10)
-
-    assert len(cover.tiles(pyramid, zoom)) == 530, "pyramid geojson"
-    assert len(cover.indexes(pyramid, zoom)) == 530, "pyramid tiles"
-
-    compare_fixture(pyramid, zoom, "pyramid_out")
-    verify_cover(pyramid, zoom)
-
-
-def test_tetris_polygon():
-    tetris = fixture("tetris")
-    zoom = (10, 10)
-
-    assert len(cover.tiles(tetris, zoom)) == 255, "tetris geojson"
-    assert len(cover.indexes(tetris, zoom)) == 255, "tetris tiles"
-
-    compare_fixture(tetris, zoom, "tetris_out")
-    verify_cover(tetris, zoom)
-
-
 def test_0_0_polygon():
     zero = fixture("zero")
     zoom = (10, 10)
@@ -393,6 +340,33 @@ def test_0_0_polygon():
     verify_cover(zero, zoom)
 
 
+def test_polygon_rings_disjoint_y():
+    # The scanline fill used to stop when it ran out of active edges, tripping
+    # its "all edges consumed" assertion if another ring started further up.
+    # NOTE: The input is deliberately invalid, since its "hole" lies outside of
+    # its shell. Shapely ignores the stray ring, so `verify_cover` can't check
+    # the tiles covering it; the exact tile assertion does instead.
+    shell = [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]
+    stray = [[0, 30], [10, 30], [10, 40], [0, 40], [0, 30]]
+    poly = geojson.Polygon([shell, stray])
+    zoom = (6, 6)
+
+    assert sorted(cover.tiles(poly, zoom)) == [
+        (32, 24, 6),
+        (32, 25, 6),
+        (32, 26, 6),
+        (32, 30, 6),
+        (32, 31, 6),
+        (32, 32, 6),
+        (33, 24, 6),
+        (33, 25, 6),
+        (33, 26, 6),
+        (33, 30, 6),
+        (33, 31, 6),
+        (33, 32, 6),
+    ]
+
+
 @pytest.mark.skip(reason="Need to confirm what the expected result is")
 def test_out_of_range_lat():
     # Reported https://github.com/mapbox/tile-cover/issues/66#issuecomment-137928786
@@ -401,6 +375,69 @@ def test_out_of_range_lat():
     verify_cover(oor, 4)
 
 
+def test_compare_geojson_checks_features():
+    # The pairwise feature comparison in `compare_geojson` was once unreachable
+    # without anyone noticing, since collections of the right length passed.
+    # Make sure swapping a tile for its neighbor is caught.
+    small = fixture("small_poly")
+    expected = raw_fixture("small_poly_out")
+    original = geojson.Feature(
+        geometry=small,
+        properties={
+            "name": "original",
+            "stroke": "#f44",
+            "fill": "#f44",
+        },
+    )
+
+    def result(tile):
+        return geojson.FeatureCollection(
+            features=[geojson.Feature(geometry=tile_to_geojson(tile)), original]
+        )
+
+    compare_geojson(result((284, 413, 10)), expected)
+    with pytest.raises(AssertionError):
+        compare_geojson(result((285, 413, 10)), expected)
+
+
+def test_tile_bounds_matches_tilebelt():
+    tiles = [(0, 0, 0), (5, 10, 10), (284, 413, 10), (74891, 100306, 18)]
+    assert tile_bounds(tiles).tolist() == [list(tile_to_bbox(t)) for t in tiles]
+    assert tile_bounds([]).shape == (0, 4)
+
+
+def test_project_line_matches_point_to_tile_fraction():
+    # `_project_line` inlines the projection for speed. Make sure it can't
+    # drift from the tilebelt version.
+    lines = [
+        [[0, 0], [10, 10], [-77.044749, 38.900194]],
+        [[179.5, 85.05], [185.25, -85.05], [-190.125, 0.000001]],
+        fixture("line").geometry.coordinates,
+    ]
+    for line in lines:
+        for z in [0, 1, 10, 18, 28]:
+            assert _project_line(line, z) == [
+                point_to_tile_fraction((p[0], p[1]), z, clamp=False)[:2] for p in line
+            ]
+
+
+def test_simplify_mixed_zoom():
+    # Tiles are only merged with siblings at their own zoom.
+    coarse = {(0, 0, 5), (1, 0, 5), (0, 1, 5), (1, 1, 5)}
+    simplify_tileset(coarse, (3, 10))
+    assert coarse == {(0, 0, 4)}
+
+    # Carry a coarse tile over from a previous cover with `original_tiles`.
+    original = {(1, 1, 3)}
+    fine = [(0, 0, 6), (1, 0, 6), (0, 1, 6)]
+    points = geojson.MultiPoint(
+        [tile_to_point((x + 0.5, y + 0.5, z)) for x, y, z in fine]
+    )
+    assert sorted(cover.tiles(points, (1, 6), original_tiles=original)) == sorted(
+        fine + [(1, 1, 3)]
+    )
+
+
 ###############################################################################
 # The rest of this file is helper functions.
 # ---
@@ -409,6 +446,8 @@ def test_out_of_range_lat():
 def compare_fixture(geom: Geom, zoom: cover.ZoomInput, expected_name: str):
     """Validate `cover.geojson` against expected output.
 
+    Also checks that `cover.geojson_str` serializes the same output.
+
     Args:
         geom - Geometry to test
         zoom - Zoom range to test
@@ -419,6 +458,8 @@ def compare_fixture(geom: Geom, zoom: cover.ZoomInput, expected_name: str):
         match the expected output contained in the file.
     """
     result = cover.geojson(geom, zoom)
+    assert cover.geojson_str(geom, zoom) == geojson.dumps(result)
+
     result.features.append(
         geojson.Feature(
             geometry=geom,
@@ -430,10 +471,13 @@ def compare_fixture(geom: Geom, zoom: cover.ZoomInput, expected_name: str):
         )
     )
 
-    compare_geojson(result, fixture(expected_name))
+    compare_indexes(index_features(result), expected_index(expected_name))
 
 
-def compare_geojson(fc1: geojson.FeatureCollection, fc2: geojson.FeatureCollection):
+def compare_geojson(
+    fc1: Union[geojson.FeatureCollection, dict],
+    fc2: Union[geojson.FeatureCollection, dict],
+):
     """Compare two geojson FeatureCollections.
 
     The FeatureCollections are checked for equivalence in each independent
@@ -443,6 +487,8 @@ def compare_geojson(fc1: geojson.FeatureCollection, fc2: geojson.FeatureCollecti
     orderings than the original library, but the resulting shapes should all
     be identical.
 
+    The FeatureCollections can either be `geojson` objects or plain dicts.
+
     Args:
         fc1 - First feature collection
         fc2 - Second feature collection
@@ -451,33 +497,91 @@ def compare_geojson(fc1: geojson.FeatureCollection, fc2: geojson.FeatureCollecti
         `AssertionError` if the two are not equivalent.
     """
     # Check length as a quick heuristic.
-    assert len(fc1.features) == len(fc2.features), "FeatureCollections length check"
-
-    # Sort features because ordering in the collection is not significant.
-    # Find the center of each feature to sort the collection. This gives us a
-    # reasonable chance of comparing the correct features across collections.
-    # Also put the "original" Geometry in a consistent place.
-    def order_feature(f: geojson.Feature):
-        name = f.properties.get("name", "")
-        c = center(f).geometry.coordinates
-        # Normalize coordinates to be in [-180, 180]. For whatever reason the
-        # original fixtures do not use normalized coordinates. The winding order
-        # might also be incorrect in the fixture, so don't rely on the raw
-        # coords in any way!
-        return (name, norm_coords(c))
-
-        fc1.features.sort(key=order_feature)
-        fc2.features.sort(key=order_feature)
-
-        for i in range(len(fc1.features)):
-            f1 = fc1.features[i]
-            f2 = fc2.features[i]
-            assert_geom_is_homomorphic(f1.geometry, f2.geometry)
-            assert f1.properties == f2.properties
+    assert len(fc1["features"]) == len(
+        fc2["features"]
+    ), "FeatureCollections length check"
+
+    compare_indexes(index_features(fc1), index_features(fc2))
+
+
+# Features of a collection grouped by name. Each group is stored along with
+# the centroids of the features and a spatial index of the centroids.
+FeatureIndex = dict[str, Tuple[list, np.ndarray, shapely.STRtree]]
+
+
+def index_features(fc: Union[geojson.FeatureCollection, dict]) -> FeatureIndex:
+    """Group the features in a collection by name and index their centroids.
+
+    Args:
+        fc - Feature collection, either as a `geojson` object or a plain dict
+
+    Returns:
+        Features and their centroids, grouped by name.
+    """
+    groups = collections.defaultdict(list)
+    for f in fc["features"]:
+        groups[f["properties"].get("name", "")].append(f)
+
+    index = FeatureIndex()
+    for name, fts in groups.items():
+        # Normalize coordinates to be in [-180, 180] before finding centroids.
+        # For whatever reason the original fixtures do not use normalized
+        # coordinates. The winding order might also be incorrect in the
+        # fixture, so don't rely on the raw coords in any way!
+        centroids = shapely.centroid([clean_geom(f["geometry"]) for f in fts])
+        index[name] = (fts, centroids, shapely.STRtree(centroids))
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def expected_index(name: str) -> FeatureIndex:
+    """Index the features of an expected output fixture.
+
+    Expected outputs never change, so each one is only indexed once per
+    session. The result must not be modified.
+
+    Args:
+        name - Name of fixture (without .geojson extension)
+
+    Returns:
+        Features and their centroids, grouped by name.
+    """
+    return index_features(raw_fixture(name))
+
+
+def compare_indexes(index1: FeatureIndex, index2: FeatureIndex):
+    """Compare the features of two indexed collections.
+
+    See `compare_geojson` for details.
+
+    Args:
+        index1 - First indexed feature collection
+        index2 - Second indexed feature collection
+
+    Raises:
+        `AssertionError` if the two are not equivalent.
+    """
+    # Ordering in the collection is not significant, so match each feature in
+    # the first collection to the feature in the second collection with the
+    # nearest centroid. Only features with the same name are candidates, which
+    # keeps the "original" Geometry from being matched with a tile.
+    assert index1.keys() == index2.keys(), "FeatureCollections names check"
+
+    for name, (fts1, centroids1, _) in index1.items():
+        fts2, _, tree2 = index2[name]
+        assert len(fts1) == len(fts2), f"FeatureCollections length check ({name})"
+
+        matches = tree2.nearest(centroids1).tolist()
+        assert len(set(matches)) == len(matches), "Features should match 1:1"
+
+        for f1, j in zip(fts1, matches):
+            f2 = fts2[j]
+            assert_geom_is_homomorphic(f1["geometry"], f2["geometry"])
+            assert f1["properties"] == f2["properties"]
 
 
 def assert_geom_is_homomorphic(
-    g1: Geom, g2: Geom, tolerance: float = DEFAULT_TOLERANCE
+    g1: Union[Geom, dict], g2: Union[Geom, dict], tolerance: float = DEFAULT_TOLERANCE
 ):
     """Check that two geometries are homomorphic.
 
@@ -487,6 +591,8 @@ def assert_geom_is_homomorphic(
     The tolerance can be set to allow some minor differences. This is prone to
     happen with floating point errors.
 
+    Geometries can either be `geojson` objects or plain dicts.
+
     Args:
         g1 - First Geom
         g2 - Second Geom
@@ -495,77 +601,121 @@ def assert_geom_is_homomorphic(
     Raises:
         `AssertionError` if the geometries are equivalent
     """
-    assert type(g1) == type(g2)
-    assert len(g1.coordinates) == len(
-        g2.coordinates
+    assert g1["type"] == g2["type"]
+    assert len(g1["coordinates"]) == len(
+        g2["coordinates"]
     ), "Coord lengths should be identical"
-    match type(g1):
-        case geojson.Point:
-            assert g1 == g2
-        case geojson.MultiPoint:
-            assert {tuple(c) for c in g1.coordinates} ^ {
-                tuple(c) for c in g2.coordinates
-            } == set()
-        case (
-            geojson.LineString
-            | geojson.MultiLineString
-            | geojson.Polygon
-            | geojson.MultiPolygon
-        ):
-            diff = difference(g1, g2)
+    match g1["type"]:
+        # Points are compared on normalized coordinates since `geojson` objects
+        # round their coordinates, while plain dicts are left as-is.
+        case "Point":
+            assert norm_coords(g1["coordinates"]) == norm_coords(g2["coordinates"])
+        case "MultiPoint":
+            # Order of points doesn't matter, so sort them before comparing.
+            a1 = np.asarray(norm_coords(g1["coordinates"]))
+            a2 = np.asarray(norm_coords(g2["coordinates"]))
+            assert np.array_equal(a1[np.lexsort(a1.T)], a2[np.lexsort(a2.T)])
+        case "LineString" | "MultiLineString" | "Polygon" | "MultiPolygon":
+            # Cleaned shapes are in a canonical form, so matching shapes are
+            # usually exactly equal. Skip the overlay in that case.
+            if clean_geom(g1).equals_exact(clean_geom(g2), 0):
+                return
+            diff, area = difference(g1, g2)
             if diff:
                 assert (
-                    diff / area(g2)
+                    diff / area
                 ) < tolerance, "Shape should be (very nearly) identical to expectation"
         case _:
-            raise ValueError(f"Not sure how to test shape of type {type(g1)}")
+            raise ValueError(f"Not sure how to test shape of type {g1['type']}")
 
 
 def norm_coords(coords, precision: int = DEFAULT_PRECISION):
     """Normalize degree coordinates into [-180, 180].
 
-    Function recursively normalizes any nested lists of coordinates.
-
     Args:
-        coords - Either a single coordinate or a list of coordinates.
+        coords - Either a single coordinate or a regular list of coordinates.
 
     Returns:
         Normalized coordinates.
     """
-    if isinstance(coords, float) or isinstance(coords, int):
-        # Taken from https://stackoverflow.com/a/2323034
-        coords = coords % 360
-        coords = (coords + 360) % 360
-        if coords > 180:
-            coords -= 360
-        return round(coords, precision)
-    return [norm_coords(c, precision=precision) for c in coords]
+    a = np.array(coords, dtype=np.float64)
+    return _norm_degrees(a, precision).tolist()
+
+
+def _norm_degrees(a: np.ndarray, precision: int) -> np.ndarray:
+    """Normalize an array of degrees into [-180, 180] in place.
+
+    Args:
+        a - Array of degrees. It will be modified.
+        precision - Decimal places to round to.
+
+    Returns:
+        The same array, normalized.
+    """
+    # Taken from https://stackoverflow.com/a/2323034. Every step is done in
+    # place to avoid allocating temporary arrays.
+    np.mod(a, 360, out=a)
+    a += 360
+    np.mod(a, 360, out=a)
+    a[a > 180] -= 360
+    np.round(a, precision, out=a)
+    return a
 
 
-def clean_geom(g: Geom) -> shapely.Geometry:
+# Shapes from `clean_geom`, keyed on the id of the input geometry. The input
+# is kept alongside its shape so that the id can't be reused while it's cached.
+_clean_geom_cache: dict[int, tuple[object, shapely.Geometry]] = {}
+
+
+@pytest.fixture(autouse=True)
+def clear_clean_geom_cache():
+    """Drop the shapes cached by `clean_geom` after each test."""
+    yield
+    _clean_geom_cache.clear()
+
+
+def clean_geom(g: Union[Geom, dict, shapely.Geometry]) -> shapely.Geometry:
     """Get a clean shapely shape from a GeoJSON geometry.
 
     Normalizes coordinates and fixes winding order. For polygons, it also uses
     the "buffer(0)" trick to clean up the shape and make it valid in certain
     circumstances where it'll otherwise detect a self-intersection.
 
+    Shapely geometries are assumed to have been built by us (e.g. by merging
+    tiles), so they only have their winding order fixed.
+
+    The same geometry tends to be cleaned several times in one test, so the
+    result is cached for the duration of the test. Geometries must not be
+    modified after they've been cleaned.
+
     Args:
-        g - Input GeoJSON geometry
+        g - Input GeoJSON geometry (or plain dict)
 
     Returns:
         Shapely geometry
     """
-    g = copy.deepcopy(g)
-    g.coordinates = norm_coords(g.coordinates)
-
-    normed = sg.shape(g).normalize()
-    if isinstance(g, geojson.Polygon) or isinstance(g, geojson.MultiPolygon):
-        normed = normed.buffer(0)
-
+    cached = _clean_geom_cache.get(id(g))
+    if cached is not None and cached[0] is g:
+        return cached[1]
+
+    if isinstance(g, shapely.Geometry):
+        normed = g.normalize()
+    else:
+        # Normalize the coordinate array of the shape rather than the nested
+        # lists in the GeoJSON, so they never need to be copied or rebuilt.
+        normed = shapely.transform(
+            sg.shape(g), lambda a: _norm_degrees(a, DEFAULT_PRECISION)
+        ).normalize()
+        if g["type"] == "Polygon" or g["type"] == "MultiPolygon":
+            normed = normed.buffer(0)
+
+    _clean_geom_cache[id(g)] = (g, normed)
     return normed
 
 
-def contains(g1: Geom, g2: Geom) -> bool:
+def contains(
+    g1: Union[Geom, dict, shapely.Geometry], g2: Union[Geom, dict, shapely.Geometry]
+) -> bool:
     """Test if g1 contains g2.
 
     Args:
@@ -578,24 +728,60 @@ def contains(g1: Geom, g2: Geom) -> bool:
     return clean_geom(g1).covers(clean_geom(g2))
 
 
-def difference(g1: Geom, g2: Geom, precision: int = DEFAULT_PRECISION) -> float:
+def difference(
+    g1: Union[Geom, dict, shapely.Geometry],
+    g2: Union[Geom, dict, shapely.Geometry],
+    precision: int = DEFAULT_PRECISION,
+) -> Tuple[float, float]:
     """Compute difference between two geometries.
 
     This method fixes coordinates and winding order if they are incorrect.
 
+    The area of the first geometry is returned as well, since callers usually
+    want the difference relative to it. Both areas are computed in one call.
+
     Args:
         g1 - First geometry
         g2 - Second geometry
         precision - Decimal places to round to
 
     Returns:
-        Area difference between two shapes
+        Tuple of the area of g1 outside of g2, and the area of g1
     """
     sg1 = clean_geom(g1)
     sg2 = clean_geom(g2)
 
-    # Take difference and compute area, rounding to given precision.
-    return round(shapely.area(shapely.difference(sg1, sg2)), precision)
+    # Take difference and compute area, rounding the difference to given
+    # precision.
+    diff, area = shapely.area([shapely.difference(sg1, sg2), sg1]).tolist()
+    return round(diff, precision), area
+
+
+def tile_bounds(tiles: list[Tile]) -> np.ndarray:
+    """Get the bounding boxes of many tiles at once.
+
+    This is a vectorized version of `tilebelt.tile_to_bbox`, using the same
+    arithmetic and rounding.
+
+    Args:
+        tiles - Tiles as (x, y, z) tuples
+
+    Returns:
+        Array with one (w, s, e, n) row per tile.
+    """
+    xyz = np.array(tiles, dtype=np.float64).reshape(-1, 3)
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    n = np.exp2(z)
+
+    def lat(y: np.ndarray) -> np.ndarray:
+        m = np.pi - 2 * np.pi * y / n
+        return (180.0 / np.pi) * np.arctan(np.sinh(m))
+
+    bounds = np.stack(
+        [360.0 * x / n - 180.0, lat(y + 1), 360.0 * (x + 1) / n - 180.0, lat(y)],
+        axis=1,
+    )
+    return np.round(bounds, DEFAULT_PRECISION, out=bounds)
 
 
 def verify_cover(
@@ -611,44 +797,77 @@ def verify_cover(
     Raises:
         `AssertionError` if the tileset coverage appears inaccurate.
     """
-    tiles = cover.geojson(geom, zoom)
-
-    # Every tile should have something inside of it.
+    # Build the tile rectangles straight from their bounds, all at once.
+    tiles = cover.tiles(geom, zoom)
+    tile_shapes = shapely.box(*tile_bounds(tiles).T)
+
+    # Every tile should have something inside of it. Use a spatial index to
+    # find all the tiles touching the geometry in one query. Tiles are always
+    # in [-180, 180], but the geometry might not be, so also query with copies
+    # of it shifted around the antimeridian if its bounds cross it.
     # NOTE: The original library does not fail if the tile is empty, it only
     # prints a warning.
-    for i, tile_ft in enumerate(tiles.features):
-        if not intersect([tile_ft.geometry, geom]):
+    tree = shapely.STRtree(tile_shapes)
+    shape = sg.shape(geom)
+    w, _, e, _ = shape.bounds
+    shifted = [shape]
+    if e > 180:
+        shifted.append(shapely.affinity.translate(shape, xoff=-360))
+    if w < -180:
+        shifted.append(shapely.affinity.translate(shape, xoff=360))
+    hits = set(tree.query(shifted, predicate="intersects")[1].tolist())
+    for i in range(len(tile_shapes)):
+        if i not in hits:
             warnings.warn(f"Tile {i} is empty", UserWarning)
 
-    # Simplify geometry
-    merged_tiles = union(tiles)
+    # Simplify geometry. Tiles at a single zoom form a grid, so they never
+    # overlap and neighbors share their edges exactly. That lets them be merged
+    # with a coverage union, which is much faster than a full union. Tiles at
+    # mixed zooms don't share vertices along their edges, so they can't be.
+    if len({t[2] for t in tiles}) == 1:
+        merged_tiles = shapely.coverage_union_all(tile_shapes)
+    else:
+        merged_tiles = shapely.unary_union(tile_shapes)
 
     # NOTE: The original library doesn't appear to handle the case of comparing
     # point and line geometries with polygons. The turfjs `difference` function
     # always returns `undefined` in JavaScript, and throws an error in Python.
-    # We use special cases to check containment of these geometries.
+    # We use special cases to check containment of these geometries. A multi-
+    # geometry is covered only if all of its parts are, so it's checked in one
+    # call rather than part by part.
     match type(geom):
-        case geojson.Point:
-            assert contains(merged_tiles.geometry, geom)
-        case geojson.MultiPoint:
-            for coord in geom.coordinates:
-                assert contains(merged_tiles.geometry, geojson.Point(coord))
-        case geojson.LineString:
-            assert contains(merged_tiles.geometry, geom)
-        case geojson.MultiLineString:
-            for line in geom.coordinates:
-                assert contains(merged_tiles.geometry, geojson.LineString(line))
+        case (
+            geojson.Point
+            | geojson.MultiPoint
+            | geojson.LineString
+            | geojson.MultiLineString
+        ):
+            assert contains(merged_tiles, geom)
         case geojson.Polygon | geojson.MultiPolygon:
             # If there's any uncovered area, check that it doesn't exceed tolerance.
-            if not contains(merged_tiles.geometry, geom):
-                uncovered_area = difference(geom, merged_tiles.geometry)
+            if not contains(merged_tiles, geom):
+                uncovered_area, area = difference(geom, merged_tiles)
                 assert (
-                    uncovered_area / area(geom) <= tolerance
-                ), f"{uncovered_area} m^2 uncovered by tiles"
+                    uncovered_area / area <= tolerance
+                ), f"{uncovered_area} square degrees uncovered by tiles"
         case _:
             raise ValueError(f"Not sure how to check coverage for type {type(geom)}")
 
 
+def get_geom(f: Union[Geom, geojson.Feature]) -> Geom:
+    """Get the geometry from a fixture.
+
+    The fixture is either a geojson.Geometry or a geojson.Feature.
+
+    Args:
+        f - either a geojson.Geometry or a geojson.Feature
+
+    Returns:
+        geojson.Geometry
+    """
+    return f.geometry if hasattr(f, "geometry") else f
+
+
 def fixture_path(name: str) -> str:
     """Get the path to a GeoJSON feature by its file name.
 
@@ -661,9 +880,13 @@ def fixture_path(name: str) -> str:
     return os.path.join(os.path.dirname(__file__), "fixtures", f"{name}.geojson")
 
 
+@functools.lru_cache(maxsize=None)
 def load_fixture(path: str) -> geojson.Feature:
     """Load GeoJSON feature from the given path.
 
+    Each file is only parsed once per session. The same object is returned on
+    every call, so callers must not modify it.
+
     Args:
         path - Path to geojson file
 
@@ -674,6 +897,25 @@ def load_fixture(path: str) -> geojson.Feature:
         return geojson.load(fh)
 
 
+@functools.lru_cache(maxsize=None)
+def load_raw_fixture(path: str) -> dict:
+    """Load GeoJSON from the given path as plain dicts.
+
+    This skips the `geojson` object model, which is quicker to parse and to
+    traverse. Use it when the result only needs to be read, like expected
+    outputs. The same object is returned on every call, so callers must not
+    modify it.
+
+    Args:
+        path - Path to geojson file
+
+    Returns:
+        Parsed JSON.
+    """
+    with open(path) as fh:
+        return json.load(fh)
+
+
 def fixture(name: str) -> Union[geojson.Feature, geojson.FeatureCollection, Geom]:
     """Load fixture by name.
 
@@ -687,3 +929,15 @@ def fixture(name: str) -> Union[geojson.Feature, geojson.FeatureCollection, Geom
         Parsed GeoJSON
     """
     return load_fixture(fixture_path(name))
+
+
+def raw_fixture(name: str) -> dict:
+    """Load fixture by name as plain dicts.
+
+    Args:
+        name - Name of fixture (without .geojson extension)
+
+    Returns:
+        Parsed JSON
+    """
+    return load_raw_fixture(fixture_path(name))
@@ -5,6 +5,7 @@ only very small changes.
 https://github.com/mapbox/tilebelt/blob/74fd365a9459a312382e6a7a811a7cba0cc713c3/test.js
 """
 import geojson
+import pytest
 
 import tile_tools.tilebelt as tilebelt
 
@@ -46,6 +47,12 @@ def test_get_siblings():
     ]
 
 
+def test_get_siblings_are_parent_children():
+    for tile in [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1), (4, 6, 3), tile1]:
+        children = tilebelt.get_children(tilebelt.get_parent(tile))
+        assert tilebelt.get_siblings(tile) == [c for c in children if c != tile]
+
+
 def test_has_siblings():
     tiles1 = [
         (0, 0, 5),
@@ -80,6 +87,8 @@ def test_has_tile():
 def test_get_quadkey():
     key = tilebelt.tile_to_quadkey((11, 3, 8))
     assert key == "00001033"
+    assert tilebelt.tile_to_quadkey((0, 0, 0)) == ""
+    assert tilebelt.tile_to_quadkey((292, 391, 10)) == "0320100322"
 
 
 def test_quadkey_to_tile():
@@ -87,6 +96,42 @@ def test_quadkey_to_tile():
     assert tilebelt.quadkey_to_tile(key) == (11, 3, 8)
 
 
+def test_morton():
+    tile = (292, 391, 10)
+    m = tilebelt.tile_to_morton(tile)
+    assert tilebelt.morton_to_tile(m, 10) == tile
+    assert tilebelt.morton_to_quadkey(m, 10) == "0320100322"
+    assert tilebelt.morton_to_tile(m >> 2, 9) == tilebelt.get_parent(tile)
+    assert tilebelt.morton_to_quadkey(0, 0) == ""
+
+    with pytest.raises(ValueError):
+        tilebelt.tile_to_morton((0, 0, 33))
+    with pytest.raises(ValueError):
+        tilebelt.morton_to_tile(5, 33)
+    with pytest.raises(ValueError):
+        tilebelt.morton_to_quadkey(5, 33)
+    for bad in [(-1, 0, 3), (0, -1, 3), (8, 0, 3), (0, 8, 3), (0, 0, -1)]:
+        with pytest.raises(ValueError):
+            tilebelt.tile_to_morton(bad)
+    for m, z in [(-1, 3), (64, 3), (1, 0), (1 << 64, 4), (1 << 64, 32), (3, -2)]:
+        with pytest.raises(ValueError):
+            tilebelt.morton_to_tile(m, z)
+        with pytest.raises(ValueError):
+            tilebelt.morton_to_quadkey(m, z)
+    assert tilebelt.morton_to_tile(63, 3) == (7, 7, 3)
+    assert tilebelt.morton_to_quadkey((1 << 64) - 1, 32) == "3" * 32
+
+
+def test_tile_to_hilbert():
+    level1 = [(0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)]
+    assert [tilebelt.tile_to_hilbert(t) for t in level1] == [0, 1, 2, 3]
+    assert tilebelt.tile_to_hilbert((0, 0, 0)) == 0
+
+    d = tilebelt.tile_to_hilbert(tile1)
+    children = [tilebelt.tile_to_hilbert(t) for t in tilebelt.get_children(tile1)]
+    assert sorted(children) == [4 * d, 4 * d + 1, 4 * d + 2, 4 * d + 3]
+
+
 def test_point_to_tile():
     tile = tilebelt.point_to_tile((0, 0), 10)
     assert tile == (512, 512, 10)
@@ -103,6 +148,12 @@ def test_point_and_tile_back_and_forth():
     assert tile == tilebelt.quadkey_to_tile(tilebelt.tile_to_quadkey(tile))
 
 
+def test_point_and_tile_fraction_back_and_forth():
+    for lat in [85.0511, -85.0511, 80, 0]:
+        tile = tilebelt.point_to_tile_fraction((10, lat), 20)
+        assert tilebelt.tile_to_point(tile) == (10, lat)
+
+
 def test_check_key_03():
     quadkey = "03"
     assert tilebelt.quadkey_to_tile(quadkey) == (1, 1, 2)
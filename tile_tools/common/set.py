@@ -1,51 +1,106 @@
+from typing import AbstractSet, Any, Iterable, Tuple
+
+# Change to a set, as (added, removed) elements.
+Delta = Tuple[frozenset, frozenset]
+
+
 class CapturingSet(set):
     """A `set` that keeps track of all of its changes.
 
     Can be swapped in for a normal set, but has worse performance and takes up
-    a lot of space.
+    more space.
+
+    Changes are recorded in `log` as deltas rather than full snapshots, so the
+    log grows with the number of elements changed instead of the size of the
+    set. Calls that don't change the set are not recorded.
 
     Useful for debugging and rendering the algorithm.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # List to keep snapshots
-        self.log = [set()]
-
-    # Methods that mutate the set
-    methods = (
-        "__isub__",
-        "__ior__",
-        "__iand__",
-        "__ixor__",
-        "add",
-        "update",
-        "pop",
-        "remove",
-        "discard",
-        "clear",
-        "intersection_update",
-        "difference_update",
-        "symmetric_difference_update",
-    )
-
-    # Wrap all mutating methods with captured call.
-    for m in methods:
-        locals()[m] = lambda self, *args, __f=m, **kwargs: self._call_with_capture(
-            object.__getattribute__(set, __f), *args, **kwargs
-        )
-
-    def _call_with_capture(self, __f, *args, **kwargs):
-        """Call `__f` and take a snapshot of the set afterwards.
+        # List of (added, removed) deltas
+        self.log = list[Delta]()
+        if self:
+            self._capture(added=self)
 
-        Args:
-            __f - The function to call
-            *args - Any of the function's args
-            **kwargs - Any of the functions kwargs
+    def _capture(self, added: Iterable = (), removed: Iterable = ()):
+        """Record a change to the set.
 
-        Returns:
-            Anything the wrapped function returns.
+        Args:
+            added - Elements that were added to the set
+            removed - Elements that were removed from the set
         """
-        result = __f(self, *args, **kwargs)
-        self.log.append(self.copy())
-        return result
+        delta = (frozenset(added), frozenset(removed))
+        if delta[0] or delta[1]:
+            self.log.append(delta)
+
+    # Methods that mutate the set. Each one works out the delta from its
+    # arguments so that the whole set never needs to be copied.
+
+    def add(self, elem: Any):
+        if elem not in self:
+            super().add(elem)
+            self._capture(added=(elem,))
+
+    def update(self, *others: Iterable):
+        added = set().union(*others) - self
+        super().update(added)
+        self._capture(added=added)
+
+    def remove(self, elem: Any):
+        super().remove(elem)
+        self._capture(removed=(elem,))
+
+    def discard(self, elem: Any):
+        if elem in self:
+            super().discard(elem)
+            self._capture(removed=(elem,))
+
+    def pop(self) -> Any:
+        elem = super().pop()
+        self._capture(removed=(elem,))
+        return elem
+
+    def clear(self):
+        removed = frozenset(self)
+        super().clear()
+        self._capture(removed=removed)
+
+    def difference_update(self, *others: Iterable):
+        removed = self.intersection(set().union(*others))
+        super().difference_update(removed)
+        self._capture(removed=removed)
+
+    def intersection_update(self, *others: Iterable):
+        removed = self.difference(set(self).intersection(*others))
+        super().difference_update(removed)
+        self._capture(removed=removed)
+
+    def symmetric_difference_update(self, other: Iterable):
+        other = set(other)
+        removed = self.intersection(other)
+        added = other - removed
+        super().difference_update(removed)
+        super().update(added)
+        self._capture(added=added, removed=removed)
+
+    # The in-place operators have to be overridden too, since `set` implements
+    # them in C without going through the methods above. mypy compares their
+    # signatures with the binary operators (which still return a plain `set`)
+    # and flags them as incompatible, though they match typeshed's `set`.
+    def __ior__(self, other: AbstractSet[Any]) -> "CapturingSet":  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def __isub__(self, other: AbstractSet[Any]) -> "CapturingSet":  # type: ignore[misc]
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other: AbstractSet[Any]) -> "CapturingSet":  # type: ignore[misc]
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other: AbstractSet[Any]) -> "CapturingSet":  # type: ignore[misc]
+        self.symmetric_difference_update(other)
+        return self
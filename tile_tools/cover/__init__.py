@@ -1,5 +1,7 @@
 from .gj import geojson_tiles as geojson
+from .gj import geojson_tiles_str as geojson_str
+from .hilbert import tiles_hilbert
 from .indexes import indexes
 from .tiles import ZoomInput, tiles
 
-__all__ = ["tiles", "indexes", "geojson", "ZoomInput"]
+__all__ = ["tiles", "tiles_hilbert", "indexes", "geojson", "geojson_str", "ZoomInput"]
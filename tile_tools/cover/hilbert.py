@@ -0,0 +1,29 @@
+from tile_tools.common.types import Geom, Tile
+from tile_tools.tilebelt import tile_to_hilbert
+
+from .tiles import ZoomInput, tiles
+
+
+def tiles_hilbert(geom: Geom, zoom: ZoomInput) -> list[Tile]:
+    """Get minimal set of tiles covering a geometry, in Hilbert curve order.
+
+    The tiles are the same as the ones returned by `tiles`. Ordering them
+    along a Hilbert curve keeps tiles that are near each other on the map near
+    each other in the list, which helps when reading them from tile storage.
+
+    Args:
+        geom - geojson Geometry to cover
+        zoom - Zoom level (or range) to compute tiles for
+
+    Returns:
+        List of (x, y, z) tiles sorted by their position on the curve.
+    """
+    ts = tiles(geom, zoom)
+    if not ts:
+        return ts
+
+    # Tiles at coarser zooms are placed where their descendants at the finest
+    # zoom would be. The curve is nested, so that's just a shift.
+    zmax = max(t[2] for t in ts)
+    ts.sort(key=lambda t: tile_to_hilbert(t) << 2 * (zmax - t[2]))
+    return ts
@@ -1,7 +1,7 @@
 from tile_tools.common.types import Geom
 from tile_tools.tilebelt import tile_to_quadkey
 
-from .tiles import ZoomInput, tiles
+from .tiles import ZoomInput, _iter_tiles
 
 
 def indexes(geom: Geom, zoom: ZoomInput) -> list[str]:
@@ -14,4 +14,4 @@ def indexes(geom: Geom, zoom: ZoomInput) -> list[str]:
     Returns:
         List of quadkey indexes corresponding to tiles.
     """
-    return [tile_to_quadkey(t) for t in tiles(geom, zoom)]
+    return [tile_to_quadkey(t) for t in _iter_tiles(geom, zoom)]
@@ -1,12 +1,13 @@
 import math
 from dataclasses import dataclass
-from typing import Optional, Tuple, Union
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
 
 import geojson
 
 from tile_tools.common.types import Geom, Point, Tile
-from tile_tools.tilebelt.point import point_to_tile, point_to_tile_fraction
-from tile_tools.tilebelt.traverse import get_parent, get_siblings
+from tile_tools.settings import DEFAULT_PRECISION
+from tile_tools.tilebelt.point import _2pi, d2r, point_to_tile
 
 # Tuple of (min_zoom, max_zoom). Max zoom should be greater than min zoom.
 ZoomRange = Tuple[int, int]
@@ -29,9 +30,13 @@ PolygonCoords = list[LineCoords]
 TileSet = set[Tile]
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
-    """Represent edge information for parity polygon fill algorithm."""
+    """Represent edge information for parity polygon fill algorithm.
+
+    Uses slots since the fill creates one of these per ring segment and reads
+    their fields on every scanline.
+    """
 
     y_min: int
     x: float
@@ -39,6 +44,12 @@ class Edge:
     im: float
 
 
+# Sort keys for edges. `attrgetter` builds the keys in C rather than calling
+# back into a Python lambda for every edge on every scanline.
+_edge_start = attrgetter("y_min", "x")
+_edge_x = attrgetter("x")
+
+
 def tiles(
     geom: Geom, zoom: ZoomInput, original_tiles: Optional[TileSet] = None
 ) -> list[Tile]:
@@ -57,35 +68,64 @@ def tiles(
     Returns:
         List of (x, y, z) tiles
     """
+    return list(_iter_tiles(geom, zoom, original_tiles=original_tiles))
+
+
+def _iter_tiles(
+    geom: Geom, zoom: ZoomInput, original_tiles: Optional[TileSet] = None
+) -> Iterator[Tile]:
+    """Generate the minimal set of tiles covering a geometry.
+
+    Same as `tiles`, but yields the normalized tiles one at a time so that
+    callers converting them to another format don't need an extra list.
+
+    Args:
+        geom - geojson Geometry to cover
+        zoom - Zoom level (or range) to compute tiles for
+        original_tiles - Initial TileSet to start from
+
+    Returns:
+        Iterator of (x, y, z) tiles
+    """
     tiles = original_tiles if original_tiles is not None else TileSet()
 
     min_zoom, max_zoom = _parse_zoom(zoom)
 
-    match type(geom):
-        case geojson.Point:
-            lng, lat = geom.coordinates
-            point_cover(tiles, (lng, lat), max_zoom)
-        case geojson.MultiPoint:
-            for point in geom.coordinates:
-                point_cover(tiles, (point[0], point[1]), max_zoom)
-        case geojson.LineString:
-            line_cover(tiles, geom.coordinates, max_zoom)
-        case geojson.MultiLineString:
-            for line in geom.coordinates:
-                line_cover(tiles, line, max_zoom)
-        case geojson.Polygon:
-            polygon_cover(tiles, geom.coordinates, max_zoom)
-        case geojson.MultiPolygon:
-            for poly in geom.coordinates:
-                polygon_cover(tiles, poly, max_zoom)
-        case _:
-            raise NotImplementedError(f"Unsupported geometry type {type(geom)}")
+    cover = _COVERS.get(type(geom))
+    if cover is None:
+        raise NotImplementedError(f"Unsupported geometry type {type(geom)}")
+    cover(tiles, geom.coordinates, max_zoom)
 
     # Interpolate coverage within the zoom range if requested.
     if min_zoom != max_zoom:
         simplify_tileset(tiles, (min_zoom, max_zoom))
 
-    return [_norm_tile(t) for t in tiles]
+    for t in tiles:
+        yield _norm_tile(t)
+
+
+def _cover_point(tiles: TileSet, coords: Point, zoom: int):
+    """Cover a Point geometry's coordinates. See `point_cover`."""
+    lng, lat = coords
+    point_cover(tiles, (lng, lat), zoom)
+
+
+def _cover_multi_point(tiles: TileSet, coords: LineCoords, zoom: int):
+    """Cover a MultiPoint geometry's coordinates."""
+    # Add all the points in one update rather than one call per point.
+    tiles.update(point_to_tile((p[0], p[1]), zoom) for p in coords)
+
+
+def _cover_multi_line(tiles: TileSet, coords: list[LineCoords], zoom: int):
+    """Cover a MultiLineString geometry's coordinates. See `line_cover`."""
+    for line in coords:
+        line_cover(tiles, line, zoom)
+
+
+def _cover_multi_polygon(tiles: TileSet, coords: list[PolygonCoords], zoom: int):
+    """Cover a MultiPolygon geometry's coordinates. See `polygon_cover`."""
+    for poly in coords:
+        polygon_cover(tiles, poly, zoom)
 
 
 def _norm_tile(t: Tile) -> Tile:
@@ -119,31 +159,37 @@ def simplify_tileset(tiles: TileSet, zoom: ZoomRange):
         zoom - Tuple of (min_zoom, max_zoom)
     """
     min_zoom, max_zoom = zoom
-    z = max_zoom
     # Widen the zoom range and replace children with parents if the parents
-    # cover all of the children.
-    parent_tiles = list(tiles)
-    while z > min_zoom:
-        next_parent_tiles = list[Tile]()
-        for t in parent_tiles:
-            # Only look at one tile of the four siblings. Doesn't matter which
-            # one we pick.
-            if t[0] % 2 == 0 and t[1] % 2 == 0:
-                sibs = set(get_siblings(t))
-                # If t and all its siblings are contained in the tile set,
-                # then delete them and replace them with the parent tile.
-                if sibs.issubset(tiles):
-                    sibs.add(t)
-                    tiles.difference_update(sibs)
-
-                    parent = get_parent(t)
-                    next_parent_tiles.append(parent)
-                    tiles.add(parent)
-        # Iterate over all the new parents we found. We don't actually need to
-        # iterate over any other tiles, since we know their siblings can't
-        # possibly be in the set.
-        parent_tiles = next_parent_tiles
-        z -= 1
+    # cover all of the children. We only need to look at the tiles that were
+    # just promoted, since no other tiles can have siblings at the new level.
+    # Tiles are grouped by their own zoom, so mixed-zoom sets (e.g. from
+    # `original_tiles`) only ever merge true siblings.
+    level = list(tiles)
+    for i in range(max_zoom - min_zoom):
+        # Record which of its four children each parent has as a bit mask,
+        # so every tile is visited once instead of probing its siblings.
+        masks = dict[Tile, int]()
+        for x, y, z in level:
+            key = (x >> 1, y >> 1, z - 1)
+            masks[key] = masks.get(key, 0) | (1 << ((x & 1) | ((y & 1) << 1)))
+
+        level = list[Tile]()
+        for parent, mask in masks.items():
+            px, py, pz = parent
+            x, y, child_z = px << 1, py << 1, pz + 1
+            children = (
+                (x, y, child_z),
+                (x + 1, y, child_z),
+                (x, y + 1, child_z),
+                (x + 1, y + 1, child_z),
+            )
+            # On the first pass every tile is in `level`, so the mask alone is
+            # enough. After that a promoted tile's siblings may be tiles that
+            # were already in the set, so check the set itself.
+            if mask == 0b1111 or (i > 0 and tiles.issuperset(children)):
+                tiles.difference_update(children)
+                tiles.add(parent)
+                level.append(parent)
 
 
 def _parse_zoom(z: ZoomInput) -> ZoomRange:
@@ -221,16 +267,17 @@ def polygon_cover(tiles: TileSet, coords: PolygonCoords, zoom: int):
     """
     all_edges = list[Edge]()
     for line in coords:
+        # Project the ring once, and use it both for the perimeter and edges.
+        projected = _project_line(line, zoom)
+
         # Add line cover to ensure full coverage around the perimeter.
-        line_cover(tiles, line, zoom)
+        _line_cover_projected(tiles, projected, zoom)
 
         # Compute edge data for polygon fill
-        n = len(line)
+        n = len(projected)
         for i in range(n - 1):
-            p0 = line[i]
-            x0, y0, _ = point_to_tile_fraction((p0[0], p0[1]), zoom, clamp=False)
-            p1 = line[(i + 1) % n]
-            x1, y1, _ = point_to_tile_fraction((p1[0], p1[1]), zoom, clamp=False)
+            x0, y0 = projected[i]
+            x1, y1 = projected[(i + 1) % n]
 
             # Don't add edges where slope is 0
             if int(y0) == int(y1):
@@ -246,7 +293,7 @@ def polygon_cover(tiles: TileSet, coords: PolygonCoords, zoom: int):
                 all_edges.append(Edge(y_min=int(y1), x=x1, y_max=int(y0), im=im))
 
     # Sort on the edges now sorts by (min-y, min-x).
-    all_edges.sort(key=lambda e: (e.y_min, e.x))
+    all_edges.sort(key=_edge_start)
 
     if not all_edges:
         return
@@ -264,8 +311,9 @@ def polygon_cover(tiles: TileSet, coords: PolygonCoords, zoom: int):
             if parity:
                 x0 = active_edges[i].x
                 x1 = active_edges[i + 1].x
-                for x in range(int(x0), int(x1) + 1):
-                    tiles.add((x, scanline, zoom))
+                # Add the whole span at once. Tiles already on the perimeter
+                # are simply absorbed by the set.
+                tiles.update((x, scanline, zoom) for x in range(int(x0), int(x1) + 1))
         # Increment scanline
         scanline += 1
         # Remove edges where y-max is at the new scanline
@@ -275,8 +323,13 @@ def polygon_cover(tiles: TileSet, coords: PolygonCoords, zoom: int):
             edge.x += edge.im
         # Transfer edges along the new scanline into the active edges list.
         _scan_edges(scanline, all_edges, active_edges)
+        # If there's a vertical gap before the next ring starts, jump straight
+        # to it rather than stepping through the empty scanlines.
+        if not active_edges and all_edges:
+            scanline = all_edges[0].y_min
+            _scan_edges(scanline, all_edges, active_edges)
         # Re-sort the active edges
-        active_edges.sort(key=lambda e: e.x)
+        active_edges.sort(key=_edge_x)
 
     assert not all_edges and not active_edges, "All edges should have been consumed"
 
@@ -293,6 +346,56 @@ def line_cover(tiles: TileSet, line: LineCoords, zoom: int, ring: bool = False):
     Returns:
         Set of covering tiles as (x, y, z) tuples.
     """
+    _line_cover_projected(tiles, _project_line(line, zoom), zoom, ring=ring)
+
+
+def _project_line(line: LineCoords, zoom: int) -> list[Tuple[float, float]]:
+    """Project line coordinates to fractional tile coordinates.
+
+    Every vertex is projected exactly once, even though most of them are
+    shared by two segments.
+
+    NOTE: when computing tiles, we disable bounds checking. This means that
+    the x-tile bounds may be negative or greater than 2**zoom. We'll have to
+    normalize those later, but in the meantime it makes it so we don't have to
+    deal with the meridian crossing nightmare.
+
+    Args:
+        line - Line coordinates
+        zoom - Zoom level
+
+    Returns:
+        List of fractional (x, y) tile coordinates
+    """
+    # This is `point_to_tile_fraction` with `clamp=False`, inlined so that the
+    # per-zoom constants and function lookups are resolved once per line.
+    # Keep the arithmetic identical so results match it exactly.
+    _2z = 1 << zoom
+    precision = DEFAULT_PRECISION
+    atanh, sin = math.atanh, math.sin
+    return [
+        (
+            round(_2z * (p[0] / 360.0 + 0.5), precision),
+            round(_2z * (0.5 - atanh(sin(p[1] * d2r)) / _2pi), precision),
+        )
+        for p in line
+    ]
+
+
+def _line_cover_projected(
+    tiles: TileSet,
+    line: list[Tuple[float, float]],
+    zoom: int,
+    ring: bool = False,
+):
+    """Generate complete minimal set of tiles covering a projected line.
+
+    Args:
+        tiles - Tile set where results will be stored
+        line - Line as fractional (x, y) tile coordinates, see `_project_line`
+        zoom - Zoom level
+        ring - Treat the line as a closed linear ring
+    """
     # If this is a ring, need to interpolate between the last coord and the
     # first coord. If it's a normal line, reduplicate the endpoint so the
     # algorithm finishes in the right spot.
@@ -302,21 +405,19 @@ def line_cover(tiles: TileSet, line: LineCoords, zoom: int, ring: bool = False):
     n = len(line)
     r = range(n if ring else n - 1)
 
+    # Resolve the math functions once, since the walk below calls them for
+    # every tile boundary it crosses.
+    floor, ceil, copysign = math.floor, math.ceil, math.copysign
+
     for i in r:
-        # NOTE: when computing tiles, we disable bounds checking. This means
-        # that the x-tile bounds may be negative or greater than 2**zoom.
-        # We'll have to normalize those later, but in the meantime it makes it
-        # so we don't have to deal with the meridian crossing nightmare.
-        p0 = line[i]
-        x0, y0, _ = point_to_tile_fraction((p0[0], p0[1]), zoom, clamp=False)
+        x0, y0 = line[i]
 
         # The tile that contains the original point must be added.
         xa, ya = int(x0), int(y0)
         tiles.add((xa, ya, zoom))
 
         # Get the adjacent point.
-        p1 = line[(i + 1) % n]
-        x1, y1, _ = point_to_tile_fraction((p1[0], p1[1]), zoom, clamp=False)
+        x1, y1 = line[(i + 1) % n]
         xb, yb = int(x1), int(y1)
 
         # If the points are in the same or adjacent tiles, we can move on.
@@ -366,20 +467,20 @@ def line_cover(tiles: TileSet, line: LineCoords, zoom: int, ring: bool = False):
             # 1) Find where the line will intersect the next longitude bound.
             next_x_bound = round(xi + x_delta, 6)
             if x_delta > 0:
-                next_x_bound = math.floor(next_x_bound)
+                next_x_bound = floor(next_x_bound)
             else:
-                next_x_bound = math.ceil(next_x_bound)
+                next_x_bound = ceil(next_x_bound)
             # The y-coord is given by y = mx.
-            yd = math.copysign(slope * (next_x_bound - xi), y_delta)
+            yd = copysign(slope * (next_x_bound - xi), y_delta)
 
             # 2) Find where the line will intersect the next latitude bound.
             next_y_bound = round(yi + y_delta, 6)
             if y_delta > 0:
-                next_y_bound = math.floor(next_y_bound)
+                next_y_bound = floor(next_y_bound)
             else:
-                next_y_bound = math.ceil(next_y_bound)
+                next_y_bound = ceil(next_y_bound)
             # The x-coord is given by x = y / m.
-            xd = math.copysign((next_y_bound - yi) / slope, x_delta)
+            xd = copysign((next_y_bound - yi) / slope, x_delta)
 
             # If the longitudinal intercept is closer than the latitudinal one,
             # then we're traveling vertically.
@@ -407,3 +508,15 @@ def line_cover(tiles: TileSet, line: LineCoords, zoom: int, ring: bool = False):
                 if yi == yti and y_delta < 0 and yti != yb:
                     yti += y_delta
                     tiles.add((xti, yti, zoom))
+
+
+# Cover function for each supported geometry type, taking the geometry's
+# coordinates. A dict lookup is cheaper than matching on the type.
+_COVERS: dict[type, Callable[[TileSet, Any, int], None]] = {
+    geojson.Point: _cover_point,
+    geojson.MultiPoint: _cover_multi_point,
+    geojson.LineString: line_cover,
+    geojson.MultiLineString: _cover_multi_line,
+    geojson.Polygon: polygon_cover,
+    geojson.MultiPolygon: _cover_multi_polygon,
+}
@@ -1,5 +1,7 @@
 from .bbox import bbox_to_tile, tile_to_bbox
 from .gj import tile_to_geojson
+from .hilbert import tile_to_hilbert
+from .morton import morton_to_quadkey, morton_to_tile, tile_to_morton
 from .point import point_to_tile, point_to_tile_fraction, tile_to_point
 from .quadkey import quadkey_to_tile, tile_to_quadkey
 from .traverse import get_children, get_parent, get_siblings, has_siblings
@@ -14,6 +16,10 @@ __all__ = [
     "has_siblings",
     "tile_to_quadkey",
     "quadkey_to_tile",
+    "tile_to_morton",
+    "morton_to_tile",
+    "morton_to_quadkey",
+    "tile_to_hilbert",
     "point_to_tile",
     "point_to_tile_fraction",
     "tile_to_point",
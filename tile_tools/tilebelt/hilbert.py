@@ -0,0 +1,35 @@
+from tile_tools.common.types import Tile
+
+
+def tile_to_hilbert(tile: Tile) -> int:
+    """Get the distance of a tile along the Hilbert curve at its zoom level.
+
+    Tiles that are close together on the curve are also close together on the
+    map, so sorting tiles by this distance keeps neighbors near each other.
+    The curve is nested: the children of a tile with distance `d` have the
+    distances `4 * d` through `4 * d + 3`.
+
+    Adapted from https://en.wikipedia.org/wiki/Hilbert_curve
+
+    Args:
+        tile - Input tile
+
+    Returns:
+        Distance along the curve, in [0, 4**z).
+    """
+    x, y, z = tile
+    last = (1 << z) - 1
+    d = 0
+    s = 1 << (z - 1) if z > 0 else 0
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve lines up with the next level.
+        if not ry:
+            if rx:
+                x = last - x
+                y = last - y
+            x, y = y, x
+        s >>= 1
+    return d
@@ -0,0 +1,139 @@
+from tile_tools.common.types import Tile
+
+# Deepest zoom that fits in a 64-bit Morton code.
+MAX_MORTON_ZOOM = 32
+
+# Each hex digit of a Morton code is two quadkey digits.
+_HEX_TO_QUADKEY = str.maketrans({f"{i:x}": f"{i >> 2}{i & 3}" for i in range(16)})
+
+
+def tile_to_morton(tile: Tile) -> int:
+    """Convert an (x, y, z) tile to a Morton code.
+
+    The Morton code interleaves the bits of x and y, exactly like a quadkey
+    does, but packs them into a single integer. Every pair of bits is one
+    quadkey digit. This makes tile arithmetic cheap: the parent of a tile is
+    `m >> 2`, and its siblings are the codes that only differ in the lowest
+    two bits. Sorting by Morton code sorts tiles in Z-order.
+
+    The zoom is not part of the code, so it has to be kept alongside it.
+
+    Args:
+        tile - Input tile
+
+    Returns:
+        Morton code as an integer that fits in 64 bits.
+
+    Raises:
+        ValueError if the zoom is negative or too deep to fit in 64 bits, or if
+        x or y are outside of [0, 2**z).
+    """
+    x, y, z = tile
+    _check_zoom(z)
+    if not (0 <= x < 1 << z and 0 <= y < 1 << z):
+        raise ValueError(f"Tile {tile} is out of bounds for zoom {z}")
+    return _spread_bits(x) | _spread_bits(y) << 1
+
+
+def morton_to_tile(m: int, z: int) -> Tile:
+    """Convert a Morton code back to an (x, y, z) tile.
+
+    Args:
+        m - Morton code
+        z - Zoom level of the tile
+
+    Returns:
+        Tile as (x, y, z) tuple.
+
+    Raises:
+        ValueError if the zoom is negative or too deep to fit in 64 bits, or if
+        the code is outside of [0, 4**z).
+    """
+    _check_code(m, z)
+    return (_compact_bits(m), _compact_bits(m >> 1), z)
+
+
+def morton_to_quadkey(m: int, z: int) -> str:
+    """Convert a Morton code to a quadkey.
+
+    Args:
+        m - Morton code
+        z - Zoom level of the tile
+
+    Returns:
+        Quadkey index as string
+
+    Raises:
+        ValueError if the zoom is negative or too deep to fit in 64 bits, or if
+        the code is outside of [0, 4**z).
+    """
+    _check_code(m, z)
+    # The hex digits of the code are pairs of quadkey digits. Format all 32
+    # possible digits and keep the ones for this zoom.
+    return format(m, "016x").translate(_HEX_TO_QUADKEY)[MAX_MORTON_ZOOM - z :]
+
+
+def _check_zoom(z: int):
+    """Check that a zoom level fits in a Morton code.
+
+    Args:
+        z - Zoom level
+
+    Raises:
+        ValueError if the zoom is negative or too deep to fit in 64 bits.
+    """
+    if z < 0:
+        raise ValueError(f"Zoom {z} can't be negative")
+    if z > MAX_MORTON_ZOOM:
+        raise ValueError(f"Zoom {z} is too deep for a Morton code")
+
+
+def _check_code(m: int, z: int):
+    """Check that a Morton code is valid for a zoom level.
+
+    Args:
+        m - Morton code
+        z - Zoom level
+
+    Raises:
+        ValueError if the zoom is invalid, or the code is outside of [0, 4**z).
+    """
+    _check_zoom(z)
+    if not 0 <= m < 1 << (2 * z):
+        raise ValueError(f"Morton code {m} is out of bounds for zoom {z}")
+
+
+def _spread_bits(v: int) -> int:
+    """Move the lower 32 bits of an integer to the even bits of 64.
+
+    Args:
+        v - Integer to spread
+
+    Returns:
+        Integer where bit `i` of the input is at bit `2 * i`.
+    """
+    v &= 0x00000000FFFFFFFF
+    v = (v | v << 16) & 0x0000FFFF0000FFFF
+    v = (v | v << 8) & 0x00FF00FF00FF00FF
+    v = (v | v << 4) & 0x0F0F0F0F0F0F0F0F
+    v = (v | v << 2) & 0x3333333333333333
+    return (v | v << 1) & 0x5555555555555555
+
+
+def _compact_bits(v: int) -> int:
+    """Collect the even bits of a 64-bit integer into the lower 32 bits.
+
+    This is the inverse of `_spread_bits`.
+
+    Args:
+        v - Integer to compact
+
+    Returns:
+        Integer where bit `2 * i` of the input is at bit `i`.
+    """
+    v &= 0x5555555555555555
+    v = (v | v >> 1) & 0x3333333333333333
+    v = (v | v >> 2) & 0x0F0F0F0F0F0F0F0F
+    v = (v | v >> 4) & 0x00FF00FF00FF00FF
+    v = (v | v >> 8) & 0x0000FFFF0000FFFF
+    return (v | v >> 16) & 0x00000000FFFFFFFF
@@ -33,15 +33,15 @@ def point_to_tile_fraction(
         Tile as (x, y, z) where x and y are floating point numbers.
     """
     lon, lat = point
-    sin = math.sin(lat * d2r)
     _2z = 1 << z
     x = _2z * (lon / 360.0 + 0.5)
-    y = _2z * (0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / pi)
+    # NOTE: 0.25 * log((1 + sin) / (1 - sin)) is the same as 0.5 * atanh(sin),
+    # which is one libm call instead of a log plus a division.
+    y = _2z * (0.5 - math.atanh(math.sin(lat * d2r)) / _2pi)
 
     if clamp:
+        # Float modulo takes the sign of the divisor, so this is never negative.
         x = x % _2z
-        if x < 0:
-            x += _2z
 
     return (round(x, precision), round(y, precision), z)
 
@@ -78,6 +78,6 @@ def tile_to_point(
     lon = 360.0 * x / _2z - 180.0
 
     n = pi - _2pi * y / _2z
-    lat = r2d * math.atan(0.5 * (math.exp(n) - math.exp(-n)))
+    lat = r2d * math.atan(math.sinh(n))
 
     return (round(lon, precision), round(lat, precision))
@@ -1,5 +1,13 @@
 from tile_tools.common.types import Tile
 
+# Quadkey digits for every 4-bit chunk of a tile's (x, y) coords, indexed by
+# `x_bits << 4 | y_bits`.
+_NIBBLE_QUADKEYS = [
+    "".join(str((x >> i & 1) | (y >> i & 1) << 1) for i in range(3, -1, -1))
+    for x in range(16)
+    for y in range(16)
+]
+
 
 def tile_to_quadkey(tile: Tile) -> str:
     """Convert an (x, y, z) tile to a quadkey.
@@ -11,17 +19,14 @@ def tile_to_quadkey(tile: Tile) -> str:
         Quadkey index as string
     """
     x, y, z = tile
-    qk = ""
-    while z > 0:
-        z -= 1
-        b = 0
-        mask = 1 << z
-        if x & mask:
-            b += 1
-        if y & mask:
-            b += 2
-        qk += str(b)
-    return qk
+    # Build the key four zoom levels at a time. Round the zoom up to a
+    # multiple of four and drop the extra leading digits at the end.
+    pad = -z % 4
+    digits = [
+        _NIBBLE_QUADKEYS[(x >> i & 0xF) << 4 | (y >> i & 0xF)]
+        for i in range(z + pad - 4, -1, -4)
+    ]
+    return "".join(digits)[pad:]
 
 
 def quadkey_to_tile(qk: str) -> Tile:
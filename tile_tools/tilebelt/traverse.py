@@ -75,11 +75,15 @@ def get_siblings(tile: Tile) -> list[Tile]:
     Returns:
         List of adjacent tiles
     """
-    # TODO: this could be optimized. We just copied the shortcut used by the
-    # original authors in @mapbox/tilebelt, and added the filter on the
-    # original tile.
-    all_parent_children = get_children(get_parent(tile, zmin=None), zmax=None)
-    return [child for child in all_parent_children if tile != child]
+    # The siblings share the parent's 2x2 block, which starts where the lowest
+    # bits of x and y are cleared. List them in the same order `get_children`
+    # uses for the parent, skipping the tile itself.
+    x, y, z = tile
+    x0, y0 = x & ~1, y & ~1
+    x1, y1 = x0 + 1, y0 + 1
+    return [
+        t for t in ((x0, y0, z), (x1, y0, z), (x1, y1, z), (x0, y1, z)) if t != tile
+    ]
 
 
 def has_siblings(tile: Tile, siblings: list[Tile]) -> bool: